@@ -1,14 +1,17 @@
-import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from dotenv import load_dotenv
 from livekit.agents import (
     Agent,
     AgentSession,
     JobContext,
     JobProcess,
+    RoomInputOptions,
     WorkerOptions,
     cli,
+    tokenize,
 )
-from livekit.agents import RoomInputOptions
 from livekit.plugins import murf, silero, deepgram, google, noise_cancellation
 from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
@@ -16,22 +19,25 @@ load_dotenv(".env.local")
 
 
 # ---------- GAME MASTER AGENT ----------
+_GAME_MASTER_INSTRUCTIONS = (
+    "You are a Game Master running a fantasy Dungeons-and-Dragons style adventure. "
+    "You speak dramatically, describe scenes vividly, and guide the player through the story. "
+    "You always remember past decisions, events, characters, and items mentioned earlier in the story. "
+    "You NEVER break character. "
+    "You end every message with a prompt for action: 'What do you do?' "
+    "Keep responses short enough for voice, but immersive."
+)
+
+
 class GameMasterAgent(Agent):
     def __init__(self):
-        super().__init__(
-            instructions=(
-                "You are a Game Master running a fantasy Dungeons-and-Dragons style adventure. "
-                "You speak dramatically, describe scenes vividly, and guide the player through the story. "
-                "You always remember past decisions, events, characters, and items mentioned earlier in the story. "
-                "You NEVER break character. "
-                "You end every message with a prompt for action: 'What do you do?' "
-                "Keep responses short enough for voice, but immersive."
-            )
-        )
+        super().__init__(instructions=_GAME_MASTER_INSTRUCTIONS)
         self.started = False
 
+    # session.say queues the speech and returns a handle; awaiting it would block
+    # until playout finishes, so handlers below only queue and move on.
     async def on_start(self, session: AgentSession):
-        await session.say(
+        session.say(
             "Welcome, traveler. Your adventure begins in the ancient kingdom of Eldoria. "
             "Before we start... what is your hero's name?",
             allow_interruptions=True,
@@ -47,7 +53,7 @@ class GameMasterAgent(Agent):
             self.hero_name = text.title()
             self.started = True
 
-            await session.say(
+            session.say(
                 f"{self.hero_name}... a legendary name. "
                 "Your journey begins deep inside the Whispering Forest. "
                 "The moon glows between the leaves, and somewhere in the darkness, a wolf howls. "
@@ -58,30 +64,46 @@ class GameMasterAgent(Agent):
             )
             return
 
-        # Normal story continuation — conversation history guides the model
-        await session.say("Understood. Let me continue the story...", allow_interruptions=True)
-
-        # Final output should be story continuation + question
-        await session.say(
-            f"{response.text}",  # player's decision becomes part of context
+        # Normal story continuation — conversation history guides the model.
+        # Final output should be story continuation + question, in one utterance
+        session.say(
+            f"{text} What do you do?",  # player's decision becomes part of context
             allow_interruptions=True,
         )
-        await session.say("What do you do?", allow_interruptions=True)
 
 
 # ---------- LIVEKIT ENTRYPOINT ----------
 def prewarm(proc: JobProcess):
-    proc.userdata["vad"] = silero.VAD.load()
+    # Load the VAD model in the background so it overlaps with the rest of process init
+    executor = ThreadPoolExecutor(max_workers=1)
+    proc.userdata["vad_future"] = executor.submit(silero.VAD.load)
+    executor.shutdown(wait=False)
 
 
 async def entrypoint(ctx: JobContext):
+    vad = await asyncio.wrap_future(ctx.proc.userdata["vad_future"])
+
     session = AgentSession(
-        stt=deepgram.STT(model="nova-3"),
+        stt=deepgram.STT(
+            model="nova-3",
+            language="en-US",
+            sample_rate=16000,
+            interim_results=True,
+            punctuate=True,
+            smart_format=True,
+            no_delay=True,
+        ),
         llm=google.LLM(),
-        tts=murf.TTS(voice="Matthew", style="Conversation"),
+        tts=murf.TTS(
+            voice="Matthew",
+            style="Conversation",
+            tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2),
+            text_pacing=True,
+        ),
         turn_detection=MultilingualModel(),
-        vad=ctx.proc.userdata["vad"],
+        vad=vad,
         preemptive_generation=True,
+        min_endpointing_delay=0.05,
     )
 
     await session.start(